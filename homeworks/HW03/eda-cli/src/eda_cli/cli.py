@@ -5,6 +5,13 @@ from typing import Optional
 
 import pandas as pd
 import typer
+from pandas._libs.parsers import STR_NA_VALUES
+
+try:  # pyarrow — необязательная зависимость: многопоточный парсер CSV
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # pragma: no cover
+    pacsv = None
 
 from .core import (
     DatasetSummary,
@@ -25,6 +32,47 @@ from .viz import (
 app = typer.Typer(help="Мини-CLI для EDA CSV-файлов")
 
 
+def _read_csv_pyarrow(path: Path, sep: str, encoding: str) -> pd.DataFrame:
+    read_options = pacsv.ReadOptions(encoding=encoding)
+    parse_options = pacsv.ParseOptions(delimiter=sep)
+    # пропусками считаем те же строки, что и pd.read_csv (включая пустые, "None", "<NA>")
+    convert_options = pacsv.ConvertOptions(
+        null_values=sorted(STR_NA_VALUES),
+        strings_can_be_null=True,
+    )
+
+    # Типы pyarrow выводит по первому блоку файла — его и читаем, чтобы поправить схему
+    # до полного (однократного) разбора
+    with pacsv.open_csv(
+        path,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options,
+    ) as reader:
+        schema = reader.schema
+    # повторяющиеся заголовки pandas переименовывает (a, a.1), pyarrow — нет
+    if len(set(schema.names)) != len(schema.names):
+        raise ValueError("duplicate column names")
+    # pyarrow сам распознаёт даты и время, pd.read_csv — нет: такие колонки читаем
+    # как строки; колонки из одних пропусков pandas читает как float64
+    column_types = {}
+    for field in schema:
+        if pa.types.is_temporal(field.type):
+            column_types[field.name] = pa.string()
+        elif pa.types.is_null(field.type):
+            column_types[field.name] = pa.float64()
+    convert_options.column_types = column_types
+
+    table = pacsv.read_csv(
+        path,
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=convert_options,
+    )
+    # строки оставляем в Arrow-буферах, без перевода в Python-объекты
+    return table.to_pandas(types_mapper={pa.string(): pd.ArrowDtype(pa.string())}.get)
+
+
 def _load_csv(
     path: Path,
     sep: str = ",",
@@ -32,6 +80,12 @@ def _load_csv(
 ) -> pd.DataFrame:
     if not path.exists():
         raise typer.BadParameter(f"Файл '{path}' не найден")
+    # pyarrow читает CSV в несколько потоков; многосимвольные sep (regex) он не умеет
+    if pacsv is not None and len(sep) == 1:
+        try:
+            return _read_csv_pyarrow(path, sep, encoding)
+        except Exception:  # noqa: BLE001
+            pass  # формат или заголовки pyarrow не подошли — пробуем обычный парсер pandas
     try:
         return pd.read_csv(path, sep=sep, encoding=encoding)
     except Exception as exc:  # noqa: BLE001
@@ -156,7 +210,7 @@ if __name__ == "__main__":
 import click
 import pandas as pd
 from pathlib import Path
-from .core import compute_quality_flags, get_categorical_summary, get_numeric_summary
+from .core import categorical_columns, compute_quality_flags
 from .viz import plot_histograms, plot_category_bars
 
 @click.group()
@@ -166,7 +220,7 @@ def cli():
 @cli.command()
 @click.argument("csv_path", type=click.Path(exists=True))
 def overview(csv_path):
-    df = pd.read_csv(csv_path)
+    df = _load_csv(Path(csv_path))
     flags = compute_quality_flags(df)
     for k, v in flags.items():
         click.echo(f"{k}: {v}")
@@ -179,7 +233,7 @@ def overview(csv_path):
 @click.option("--title", default="EDA Report", help="Title of the report.")
 @click.option("--min-missing-share", default=0.1, help="Threshold for highlighting columns with many missing values.")
 def report(csv_path, out_dir, max_hist_columns, top_k_categories, title, min_missing_share):
-    df = pd.read_csv(csv_path)
+    df = _load_csv(Path(csv_path))
     out_path = Path(out_dir)
     out_path.mkdir(exist_ok=True)
 
@@ -206,7 +260,7 @@ def report(csv_path, out_dir, max_hist_columns, top_k_categories, title, min_mis
         plot_histograms(df[numeric_cols], out_path / "histograms.png")
         report_lines.append("\n![Histograms](histograms.png)")
 
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
+    categorical_cols = categorical_columns(df)
     for col in categorical_cols:
         top_vals = df[col].value_counts().head(top_k_categories)
         plot_category_bars(top_vals, out_path / f"bar_{col}.png")
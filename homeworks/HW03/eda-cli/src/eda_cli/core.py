@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 from pandas.api import types as ptypes
 
+try:  # pyarrow — необязательная зависимость, нужна только для Arrow-колонок
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pc = None
+
 
 @dataclass
 class ColumnSummary:
@@ -135,6 +142,24 @@ def correlation_matrix(df: pd.DataFrame) -> pd.DataFrame:
     return numeric_df.corr(numeric_only=True)
 
 
+def _is_arrow_string_dtype(dtype: Any) -> bool:
+    """Строковая колонка на Arrow-буферах (например, после загрузки CSV через pyarrow)."""
+    return isinstance(dtype, pd.ArrowDtype) and dtype.type is str
+
+
+def categorical_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Категориальные/строковые колонки: object, category и строки на Arrow-буферах.
+    """
+    return [
+        name
+        for name, dtype in df.dtypes.items()
+        if ptypes.is_object_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+        or _is_arrow_string_dtype(dtype)
+    ]
+
+
 def top_categories(
     df: pd.DataFrame,
     max_columns: int = 5,
@@ -145,12 +170,7 @@ def top_categories(
     Возвращает словарь: колонка -> DataFrame со столбцами value/count/share.
     """
     result: Dict[str, pd.DataFrame] = {}
-    candidate_cols: List[str] = []
-
-    for name in df.columns:
-        s = df[name]
-        if ptypes.is_object_dtype(s) or isinstance(s.dtype, pd.CategoricalDtype):
-            candidate_cols.append(name)
+    candidate_cols = categorical_columns(df)
 
     for name in candidate_cols[:max_columns]:
         s = df[name]
@@ -226,41 +246,176 @@ def flatten_summary_for_print(summary: DatasetSummary) -> pd.DataFrame:
 
 import pandas as pd
 
+# С какого размера подсчёт уникальных по колонкам раздаётся пулу потоков
+_PARALLEL_MIN_COLS = 8
+_PARALLEL_MIN_ROWS = 10_000
+
+
+def _scan_numeric(arr: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Статистики по колонкам 2-D float-массива: число пропусков, число нулей, min и max.
+    """
+    missing = np.isnan(arr).sum(axis=0)
+    zeros = (arr == 0).sum(axis=0)
+    # fmin/fmax пропускают NaN; для колонки из одних NaN результат — NaN
+    mins = np.fmin.reduce(arr, axis=0)
+    maxs = np.fmax.reduce(arr, axis=0)
+    return missing, zeros, mins, maxs
+
+
+def _category_nunique(s: pd.Series) -> int:
+    """
+    Число уникальных значений category-колонки (без NaN) по её кодам.
+    Неиспользуемые категории не учитываются.
+    """
+    codes = s.cat.codes.to_numpy()
+    return int(np.count_nonzero(np.bincount(codes[codes >= 0])))
+
+
+def _arrow_nunique(s: pd.Series) -> int:
+    """
+    Число уникальных значений Arrow-колонки (без null) через pyarrow.compute.
+    """
+    return int(pc.count_distinct(s.array.__arrow_array__(), mode="only_valid").as_py())
+
+
+def _nunique_per_column(df: pd.DataFrame, positions: np.ndarray) -> np.ndarray:
+    """
+    nunique() по колонкам с номерами positions (в том же порядке).
+    На широких и длинных датафреймах колонки обрабатываются в пуле потоков:
+    хеш-таблицы pandas написаны на C и частично отпускают GIL.
+    """
+    if len(positions) < _PARALLEL_MIN_COLS or len(df) < _PARALLEL_MIN_ROWS:
+        return df.iloc[:, positions].nunique().to_numpy(dtype=np.int64)
+    with ThreadPoolExecutor() as pool:
+        counts = list(pool.map(lambda j: df.iloc[:, j].nunique(), positions))
+    return np.array(counts, dtype=np.int64)
+
+
+def _cardinality_exceeds(s: pd.Series, threshold: int, sample_size: int = 10_000) -> bool:
+    """
+    Быстрая проверка «уникальных значений (без NaN) больше threshold» по началу колонки.
+    Точное число уникальных не считается: False значит лишь, что на префиксе порог не превышен.
+    """
+    # Работаем с «сырым» массивом (для category — с кодами), минуя обёртку Series
+    values = s.array if ptypes.is_extension_array_dtype(s.dtype) else s.to_numpy(copy=False)
+    head = values[: max(10 * threshold, sample_size)]
+    # пропуски получают код -1 и в подсчёт не попадают
+    codes, _ = pd.factorize(head, sort=False)
+    return codes.size > 0 and int(codes.max()) + 1 > threshold
+
+
 def compute_quality_flags(df: pd.DataFrame, max_cardinality_threshold: int = 50) -> dict:
     """Вычисляет флаги качества данных."""
     n_rows, n_cols = df.shape
 
+    # Пустой датафрейм (нет строк или нет колонок) — проверять нечего
+    if n_rows == 0 or n_cols == 0:
+        return {
+            "has_missing": False,
+            "missing_share": 0.0,
+            "has_constant_columns": False,
+            "has_high_cardinality_categoricals": False,
+            "has_suspicious_id_duplicates": False,
+            "has_many_zero_values": False,
+            "quality_score": 1.0,
+        }
+
+    # Типы колонок разбираем один раз, без повторных select_dtypes. Дальше работаем
+    # с позициями колонок (булевы маски длины n_cols): имена колонок могут повторяться
+    dtypes = list(df.dtypes)
+    # complex в float64 без потерь не переводится, поэтому в числовой блок не входит
+    is_complex = np.array([ptypes.is_complex_dtype(dt) for dt in dtypes], dtype=bool)
+    is_numeric = np.array(
+        [ptypes.is_numeric_dtype(dt) and not ptypes.is_bool_dtype(dt) for dt in dtypes],
+        dtype=bool,
+    ) & ~is_complex
+    is_integer = np.array([ptypes.is_integer_dtype(dt) for dt in dtypes], dtype=bool)
+    is_category = np.array([isinstance(dt, pd.CategoricalDtype) for dt in dtypes], dtype=bool)
+    is_arrow_string = np.array([_is_arrow_string_dtype(dt) for dt in dtypes], dtype=bool)
+    is_categorical = is_category | is_arrow_string | np.array([dt == object for dt in dtypes])
+    is_id = np.asarray(
+        df.columns.str.contains('id', case=False, regex=False, na=False), dtype=bool
+    )
+    numeric_pos = np.flatnonzero(is_numeric)
+
+    # Числовой блок один раз переводим в float64-массив и за один проход считаем
+    # пропуски, нули, min и max — их хватает и для пропусков, и для нулей, и для констант
+    arr = df.iloc[:, numeric_pos].to_numpy(dtype=np.float64, copy=False)
+    num_missing, zero_counts, num_mins, num_maxs = _scan_numeric(arr)
+
     # Оригинальные эвристики (пример)
-    missing_share = df.isnull().mean().max()
+    # Пропуски: для числового блока — из общего прохода, для остальных колонок — isna.
+    # Нужна только максимальная доля, поэтому Series «колонка -> доля» не собираем
+    other_df = df.iloc[:, np.flatnonzero(~is_numeric)]
+    other_missing = other_df.isna().to_numpy().sum(axis=0)
+    missing_counts = np.zeros(n_cols, dtype=np.int64)
+    missing_counts[numeric_pos] = num_missing
+    missing_counts[~is_numeric] = other_missing
+    missing_share = missing_counts.max() / n_rows
     has_missing = missing_share > 0
 
     # НОВЫЕ ЭВРИСТИКИ:
 
+    # Категориальные колонки, где порог (не меньше 1) превышен уже на префиксе, заведомо
+    # не константные: полный (и самый дорогой) подсчёт уникальных для них пропускаем
+    quick_high_cardinality = np.zeros(n_cols, dtype=bool)
+    if max_cardinality_threshold >= 1 and n_rows > max(10 * max_cardinality_threshold, 10_000):
+        for j in np.flatnonzero(is_categorical & ~is_id):
+            quick_high_cardinality[j] = _cardinality_exceeds(
+                df.iloc[:, j], max_cardinality_threshold
+            )
+
+    # Числовым колонкам (кроме ID) точное число уникальных не нужно: константность
+    # видна по min/max и пропускам из общего прохода. Это верно, только если перевод
+    # в float64 не склеил разные значения: для float — всегда, для целых — лишь при
+    # |x| < 2**53 (min/max проверяем уже после перевода, он монотонный)
+    exact_in_float = np.ones(n_cols, dtype=bool)
+    with np.errstate(invalid="ignore"):
+        exact_in_float[numeric_pos] = ~is_integer[numeric_pos] | (
+            (np.abs(num_mins) < 2**53) & (np.abs(num_maxs) < 2**53)
+        )
+    scanned_numeric = is_numeric & ~is_id & exact_in_float
+    numeric_constant = np.zeros(n_cols, dtype=bool)
+    # NaN, как и в nunique(), не считаются: колонка из одних NaN не константная
+    # (её min/max — NaN, а NaN != NaN)
+    numeric_constant[numeric_pos] = num_mins == num_maxs
+
+    # Число уникальных по позициям колонок; -1 — не считали (хватило префикса или min/max).
+    # Для category-колонок берём его по целочисленным кодам, без хеширования значений,
+    # для Arrow-строк — через pyarrow.compute по непрерывным буферам,
+    # для остальных — один общий подсчёт
+    nuniques = np.full(n_cols, -1, dtype=np.int64)
+    for j in np.flatnonzero(is_category & ~quick_high_cardinality):
+        nuniques[j] = _category_nunique(df.iloc[:, j])
+    for j in np.flatnonzero(is_arrow_string & ~quick_high_cardinality):
+        nuniques[j] = _arrow_nunique(df.iloc[:, j])
+    rest = ~(quick_high_cardinality | is_category | is_arrow_string | scanned_numeric)
+    nuniques[rest] = _nunique_per_column(df, np.flatnonzero(rest))
+
     # 1. Есть ли константные колонки?
-    has_constant_columns = (df.nunique() == 1).any()
+    constant_mask = np.where(scanned_numeric, numeric_constant, nuniques == 1)
+    has_constant_columns = bool(constant_mask.any())
 
     # 2. Есть ли категориальные колонки с высокой кардинальностью?
-    # Предполагаем: только object/dtype == 'category'
-    categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-    has_high_cardinality_categoricals = False
-    if len(categorical_cols) > 0:
-        max_unique = df[categorical_cols].nunique().max()
-        has_high_cardinality_categoricals = max_unique > max_cardinality_threshold
+    # Категориальные — как в categorical_columns: object, category и Arrow-строки
+    # Уникальных не больше, чем строк: при n_rows <= порога превышения быть не может
+    has_high_cardinality_categoricals = bool(quick_high_cardinality.any())
+    if not has_high_cardinality_categoricals and n_rows > max_cardinality_threshold:
+        cat_nuniques = nuniques[is_categorical & ~quick_high_cardinality]
+        has_high_cardinality_categoricals = bool((cat_nuniques > max_cardinality_threshold).any())
 
     # 3. Дубликаты в потенциальных ID-колонках (если есть колонки с 'id' в названии)
-    has_suspicious_id_duplicates = False
-    id_cols = [col for col in df.columns if 'id' in col.lower()]
-    for col in id_cols:
-        if df[col].duplicated().any():
-            has_suspicious_id_duplicates = True
-            break
+    # Дубликаты есть, если уникальных меньше, чем строк. В duplicated NaN — обычное значение,
+    # поэтому к nunique (без NaN) добавляем 1 для колонок, где пропуски есть
+    id_nuniques = nuniques[is_id] + (missing_counts[is_id] > 0)
+    has_suspicious_id_duplicates = bool((id_nuniques < n_rows).any())
 
     # 4. Много ли нулей в числовых колонках? (более 80%)
-    numeric_cols = df.select_dtypes(include='number').columns
-    has_many_zero_values = False
-    if len(numeric_cols) > 0:
-        zero_share = (df[numeric_cols] == 0).mean().max()
-        has_many_zero_values = zero_share > 0.8
+    complex_zero_counts = (df.iloc[:, np.flatnonzero(is_complex)].to_numpy() == 0).sum(axis=0)
+    has_many_zero_values = bool(
+        (zero_counts / n_rows > 0.8).any() or (complex_zero_counts / n_rows > 0.8).any()
+    )
 
     # Итоговый словарь
     quality_flags = {
@@ -51,6 +51,45 @@ def plot_histograms_per_column(
     return paths
 
 
+def plot_histograms(df: pd.DataFrame, out_path: PathLike, bins: int = 20) -> Path:
+    """
+    Гистограммы всех колонок df (ожидаются числовые) на одной картинке.
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    n_cols = max(df.shape[1], 1)
+    fig, axes = plt.subplots(1, n_cols, figsize=(4 * n_cols, 3), squeeze=False)
+    for ax, (name, s) in zip(axes[0], df.items()):
+        ax.hist(s.dropna().values, bins=bins)
+        ax.set_title(f"Histogram of {name}")
+        ax.set_ylabel("Count")
+
+    fig.tight_layout()
+    fig.savefig(out_path)
+    plt.close(fig)
+    return out_path
+
+
+def plot_category_bars(counts: pd.Series, out_path: PathLike) -> Path:
+    """
+    Столбчатая диаграмма частот категорий (например, value_counts().head(k)).
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fig, ax = plt.subplots()
+    ax.bar(counts.index.astype(str), counts.to_numpy())
+    ax.set_title(f"Top categories of {counts.index.name}")
+    ax.set_ylabel("Count")
+    ax.tick_params(axis="x", rotation=90, labelsize=8)
+
+    fig.tight_layout()
+    fig.savefig(out_path)
+    plt.close(fig)
+    return out_path
+
+
 def plot_missing_matrix(df: pd.DataFrame, out_path: PathLike) -> Path:
     """
     Простая визуализация пропусков: где True=пропуск, False=значение.
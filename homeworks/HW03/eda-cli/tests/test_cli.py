@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+import typer
+from click.testing import CliRunner
+
+from eda_cli import cli as cli_module
+from eda_cli.cli import _load_csv, cli
+
+EXAMPLE_CSV = Path(__file__).resolve().parents[1] / "data" / "example.csv"
+
+
+def test_load_csv_matches_pandas_values():
+    df = _load_csv(EXAMPLE_CSV)
+    expected = pd.read_csv(EXAMPLE_CSV)
+
+    assert list(df.columns) == list(expected.columns)
+    for name in expected.columns:
+        assert df[name].isna().sum() == expected[name].isna().sum()
+        assert df[name].astype(object).where(df[name].notna(), None).tolist() == (
+            expected[name].astype(object).where(expected[name].notna(), None).tolist()
+        )
+
+
+def test_load_csv_keeps_dates_as_strings(tmp_path):
+    path = tmp_path / "dates.csv"
+    path.write_text("day,ts,x\n2024-01-02,2024-01-03T11:00:00,1\n2024-02-03,,2\n")
+
+    df = _load_csv(path)
+
+    assert df["day"].tolist() == ["2024-01-02", "2024-02-03"]
+    assert df["ts"].iloc[0] == "2024-01-03T11:00:00"
+    assert df["ts"].isna().iloc[1]
+
+
+def test_load_csv_renames_duplicate_headers(tmp_path):
+    path = tmp_path / "dup.csv"
+    path.write_text("a,a,b\n1,2,3\n4,5,6\n")
+
+    df = _load_csv(path)
+
+    assert list(df.columns) == ["a", "a.1", "b"]
+    assert df.equals(pd.read_csv(path))
+
+
+def test_load_csv_pandas_null_tokens(tmp_path):
+    path = tmp_path / "nulls.csv"
+    path.write_text("x,y\n1,None\n2,3\n<NA>,4\n")
+
+    df = _load_csv(path)
+
+    assert df["x"].dtype == "float64" and df["y"].dtype == "float64"
+    assert df["x"].isna().tolist() == [False, False, True]
+    assert df["y"].isna().tolist() == [True, False, False]
+
+
+def test_load_csv_all_empty_column_is_float(tmp_path):
+    path = tmp_path / "empty_col.csv"
+    path.write_text("x,y\n1,\n2,\n")
+
+    df = _load_csv(path)
+
+    assert df["y"].dtype == "float64"
+    assert df["y"].isna().all()
+
+
+def test_load_csv_falls_back_to_pandas(tmp_path):
+    pytest.importorskip("pyarrow")
+    # Лишнее поле во второй строке: pyarrow падает, pandas берёт первую колонку в индекс
+    path = tmp_path / "ragged.csv"
+    path.write_text("a,b\n1,2,3\n4,5\n")
+
+    df = _load_csv(path)
+
+    assert df.equals(pd.read_csv(path))
+
+
+def test_load_csv_without_pyarrow(monkeypatch):
+    monkeypatch.setattr(cli_module, "pacsv", None)
+    df = _load_csv(EXAMPLE_CSV)
+    assert df.equals(pd.read_csv(EXAMPLE_CSV))
+
+
+def test_load_csv_missing_file(tmp_path):
+    with pytest.raises(typer.BadParameter):
+        _load_csv(tmp_path / "nope.csv")
+
+
+def test_click_report_draws_category_bars(tmp_path):
+    out_dir = tmp_path / "report"
+    result = CliRunner().invoke(cli, ["report", str(EXAMPLE_CSV), "--out-dir", str(out_dir)])
+
+    assert result.exit_code == 0, result.output
+    for name in ["country", "city", "device", "channel", "plan"]:
+        assert (out_dir / f"bar_{name}.png").exists()
+    assert (out_dir / "histograms.png").exists()
+    assert "### city" in (out_dir / "report.md").read_text()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from eda_cli.core import (
+    categorical_columns,
     compute_quality_flags,
     correlation_matrix,
     flatten_summary_for_print,
@@ -115,4 +118,129 @@ def test_missing_table_and_quality_flags():
     })
     flags = compute_quality_flags(df)
     assert flags["has_missing"] is True
-   
\ No newline at end of file
+   
+
+def test_quality_flags_empty_dataframe():
+    for df in (pd.DataFrame(), pd.DataFrame({"a": []}), pd.DataFrame(index=range(3))):
+        flags = compute_quality_flags(df)
+        assert flags["has_missing"] is False
+        assert flags["missing_share"] == 0.0
+        assert flags["quality_score"] == 1.0
+
+
+def test_high_cardinality_detected_on_prefix():
+    n = 20_000
+    df = pd.DataFrame({"cat": [f"cat_{i}" for i in range(n)], "const": ["x"] * n})
+    flags = compute_quality_flags(df, max_cardinality_threshold=50)
+    assert flags["has_high_cardinality_categoricals"] is True
+    assert flags["has_constant_columns"] is True
+
+
+def test_constant_column_with_zero_cardinality_threshold():
+    df = pd.DataFrame({"const": ["x"] * 20_000})
+    flags = compute_quality_flags(df, max_cardinality_threshold=0)
+    assert flags["has_high_cardinality_categoricals"] is True
+    assert flags["has_constant_columns"] is True
+
+
+def test_many_zero_values_wide_frame():
+    n = 20_000
+    df = pd.DataFrame({f"x{i}": [0.0] * n for i in range(50)})
+    df["nonzero"] = 1.0
+    flags = compute_quality_flags(df)
+    assert flags["has_many_zero_values"] is True
+
+
+def test_constant_category_column_with_unused_categories():
+    df = pd.DataFrame({"c": pd.Categorical(["a", "a", "a"], categories=["a", "b"])})
+    flags = compute_quality_flags(df)
+    assert flags["has_constant_columns"] is True
+
+
+def test_quality_flags_arrow_strings():
+    pa = pytest.importorskip("pyarrow")
+    df = pd.DataFrame(
+        {
+            "cat": pd.array([f"cat_{i}" for i in range(100)], dtype=pd.ArrowDtype(pa.string())),
+            "const": pd.array(["x"] * 100, dtype=pd.ArrowDtype(pa.string())),
+        }
+    )
+    flags = compute_quality_flags(df, max_cardinality_threshold=50)
+    assert flags["has_high_cardinality_categoricals"] is True
+    assert flags["has_constant_columns"] is True
+    assert "cat" in top_categories(df)
+    assert categorical_columns(df) == ["cat", "const"]
+
+
+def test_non_string_column_label_is_not_id():
+    df = pd.DataFrame({0: [1, 1], "b": [3, 4]})
+    flags = compute_quality_flags(df)
+    assert flags["has_suspicious_id_duplicates"] is False
+
+
+def test_suspicious_id_duplicates_wide_frame():
+    n = 20_000
+    df = pd.DataFrame({f"id_{i}": [f"k{j}" for j in range(n)] for i in range(10)})
+    df["user_id"] = [j // 2 for j in range(n)]
+    flags = compute_quality_flags(df)
+    assert flags["has_suspicious_id_duplicates"] is True
+    assert flags["has_constant_columns"] is False
+
+
+def test_quality_flags_recomputed_after_inplace_edit():
+    df = pd.DataFrame({"user_id": [1.0, 2.0, 3.0, 4.0]})
+    flags = compute_quality_flags(df)
+    assert flags["has_missing"] is False
+    assert flags["has_suspicious_id_duplicates"] is False
+
+    df.loc[0, "user_id"] = np.nan
+    df.loc[3, "user_id"] = 2.0
+    flags = compute_quality_flags(df)
+    assert flags["has_missing"] is True
+    assert flags["has_suspicious_id_duplicates"] is True
+
+
+def test_quality_flags_duplicate_column_names():
+    df = pd.DataFrame([[1, 0, "x"], [1, 2, None]], columns=["a", "a", "user_id"])
+    flags = compute_quality_flags(df)
+    assert flags["has_constant_columns"] is True
+    assert flags["has_missing"] is True
+    assert flags["missing_share"] == 0.5
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([np.nan, np.nan, np.nan], False),
+        ([1.0, 1.0, np.nan], True),
+        ([2.5, 2.5, 2.5], True),
+        ([2**53, 2**53 + 1, 2**53], False),
+        ([2**62, 2**62, 2**62], True),
+        ([1j, 2j, 1j], False),
+    ],
+)
+def test_constant_numeric_column_rule(values, expected):
+    flags = compute_quality_flags(pd.DataFrame({"x": values}))
+    assert flags["has_constant_columns"] is expected
+
+
+def test_quality_flags_ignore_nan_like_nunique():
+    df = pd.DataFrame(
+        {
+            "cat": [f"v{i}" for i in range(50)] + [None],
+            "cat_const": pd.Categorical(["a"] * 50 + [None]),
+            "user_id": list(range(50)) + [np.nan],
+        }
+    )
+    flags = compute_quality_flags(df, max_cardinality_threshold=50)
+    assert flags["has_high_cardinality_categoricals"] is False
+    assert flags["has_constant_columns"] is True
+    assert flags["has_suspicious_id_duplicates"] is False
+
+    df.loc[49, "user_id"] = np.nan
+    assert compute_quality_flags(df)["has_suspicious_id_duplicates"] is True
+
+
+def test_many_zero_values_complex_column():
+    df = pd.DataFrame({"z": [0j, 0j, 0j, 0j, 0j, 1j]})
+    assert compute_quality_flags(df)["has_many_zero_values"] is True